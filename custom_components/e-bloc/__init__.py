@@ -1,26 +1,190 @@
 import logging
-from homeassistant.core import HomeAssistant
+import os
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.config_entries import ConfigEntry
-from .const import DOMAIN
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+from .const import (
+    DOMAIN,
+    ENDPOINTS,
+    CONF_MEMORY_LEAN,
+    SERVICE_REFRESH,
+    ATTR_ENTRY_ID,
+    ATTR_APARTMENT,
+    ATTR_ENDPOINTS,
+    SERVICE_START_RECORDING,
+    SERVICE_STOP_RECORDING,
+    RECORDINGS_DIR,
+)
+from .coordinator import EBlocDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 def mask_value(value):
     """Maschează valoarea, afișând doar primele 3 caractere."""
-    if not value or len(value) <= 3:
+    if not isinstance(value, str) or len(value) <= 3:
         return value
     return value[:3] + '*' * (len(value) - 3)
 
 
+TARGET_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_APARTMENT): cv.string,
+    }
+)
+
+REFRESH_SCHEMA = TARGET_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_ENDPOINTS): vol.All(cv.ensure_list, [vol.In(list(ENDPOINTS))]),
+    }
+)
+
+
+def _get_coordinators(hass: HomeAssistant, call: ServiceCall):
+    """Returnează perechile (ID intrare, coordonator) selectate de apelul serviciului."""
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    apartment = call.data.get(ATTR_APARTMENT)
+
+    coordinators = [
+        (coordinator_entry_id, coordinator)
+        for coordinator_entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if (not entry_id or coordinator_entry_id == entry_id)
+        and (not apartment or str(coordinator.config.get("pIdAp")) == apartment)
+    ]
+    if not coordinators:
+        _LOGGER.warning(
+            "Nicio intrare E-bloc nu corespunde cererii %s (intrare: %s, apartament: %s).",
+            call.service,
+            entry_id,
+            apartment,
+        )
+    return coordinators
+
+
+def _recording_path(hass: HomeAssistant, entry_id):
+    """Calea fișierului în care se salvează înregistrarea unei intrări."""
+    return hass.config.path(
+        RECORDINGS_DIR, f"{entry_id}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+
+
+async def _async_handle_refresh(hass: HomeAssistant, call: ServiceCall):
+    """Cere reîmprospătarea endpoint-urilor pentru intrările selectate."""
+    endpoints = call.data.get(ATTR_ENDPOINTS)
+    for _, coordinator in _get_coordinators(hass, call):
+        await coordinator.async_request_endpoints_refresh(endpoints)
+
+
+async def _async_handle_start_recording(hass: HomeAssistant, call: ServiceCall):
+    """Începe înregistrarea traficului HTTP pentru intrările selectate."""
+    for _, coordinator in _get_coordinators(hass, call):
+        coordinator.async_start_recording()
+
+
+async def _async_handle_stop_recording(hass: HomeAssistant, call: ServiceCall):
+    """Oprește înregistrarea și salvează câte un fișier pentru fiecare intrare."""
+    for entry_id, coordinator in _get_coordinators(hass, call):
+        path = _recording_path(hass, entry_id)
+        count = await coordinator.async_stop_recording(path)
+        if count is None:
+            _LOGGER.warning("Intrarea %s nu înregistra cereri.", entry_id)
+        else:
+            _LOGGER.info("Au fost salvate %s cereri în %s", count, os.path.relpath(path, hass.config.config_dir))
+
+
+async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reîncarcă intrarea după modificarea opțiunilor."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """
+    Înregistrează serviciile integrării, comune tuturor intrărilor.
+    """
+    async def handle_refresh(call: ServiceCall):
+        await _async_handle_refresh(hass, call)
+
+    async def handle_start_recording(call: ServiceCall):
+        await _async_handle_start_recording(hass, call)
+
+    async def handle_stop_recording(call: ServiceCall):
+        await _async_handle_stop_recording(hass, call)
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, handle_refresh, schema=REFRESH_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_START_RECORDING, handle_start_recording, schema=TARGET_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_STOP_RECORDING, handle_stop_recording, schema=TARGET_SCHEMA)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """
+    Migrează intrările create de versiunile anterioare.
+
+    Versiunea 1 folosea același dispozitiv și aceleași unique_id pentru toate
+    intrările; versiunea 2 le prefixează cu ID-ul intrării.
+    """
+    if entry.version == 1:
+        _LOGGER.debug("Migrăm intrarea %s la versiunea 2.", entry.entry_id)
+        prefix = f"{DOMAIN}_{entry.entry_id}_"
+
+        @callback
+        def _migrate_unique_id(entity_entry):
+            if entity_entry.unique_id.startswith(prefix):
+                return None
+            suffix = entity_entry.unique_id.removeprefix(f"{DOMAIN}_")
+            return {"new_unique_id": f"{prefix}{suffix}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, _migrate_unique_id)
+
+        # Dispozitivul comun devine dispozitivul intrării care îl deținea
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "home")})
+        if device and entry.entry_id in device.config_entries:
+            if device.config_entries == {entry.entry_id}:
+                device_registry.async_update_device(
+                    device.id, new_identifiers={(DOMAIN, entry.entry_id)}
+                )
+            else:
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=entry.entry_id
+                )
+
+        # Opțiunile nu se mai păstrează în `data`
+        data = dict(entry.data)
+        options = dict(entry.options)
+        if CONF_MEMORY_LEAN in data:
+            options.setdefault(CONF_MEMORY_LEAN, data.pop(CONF_MEMORY_LEAN))
+
+        hass.config_entries.async_update_entry(entry, data=data, options=options, version=2)
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     Configurează integrarea utilizând Config Entry.
     """
     _LOGGER.debug("Inițializăm integrarea pentru E-bloc. ID intrare: %s", entry.entry_id)
 
+    coordinator = EBlocDataUpdateCoordinator(
+        hass, entry.data, memory_lean=entry.options.get(CONF_MEMORY_LEAN, False)
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Sesiunea HTTP a fost deja creată; o închidem înainte de reîncercare
+        await coordinator.async_close()
+        raise
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Maschează datele pentru loguri
     masked_data = {key: mask_value(value) for key, value in entry.data.items()}
@@ -29,6 +193,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Configurăm platformele folosind metoda corectă
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
 
+    # Reîncărcăm intrarea când opțiunile se schimbă (ex. modul economic de memorie)
+    entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
+
     return True
 
 
@@ -39,11 +206,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Încercăm să eliminăm integrarea pentru E-bloc. ID intrare: %s", entry.entry_id)
 
     # Eliminăm datele specifice acestei intrări
-    if entry.entry_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        _LOGGER.debug("Intrarea a fost eliminată cu succes.")
+    if entry.entry_id in hass.data.get(DOMAIN, {}):
         # Descărcăm platformele asociate
-        return await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+        if not await hass.config_entries.async_unload_platforms(entry, ["sensor"]):
+            return False
+
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_cancel_pending_refresh()
+        # O înregistrare în curs este salvată înainte de închiderea sesiunii
+        if coordinator.recording:
+            await coordinator.async_stop_recording(_recording_path(hass, entry.entry_id))
+        await coordinator.async_close()
+        _LOGGER.debug("Intrarea a fost eliminată cu succes.")
+        return True
 
     _LOGGER.warning("Intrarea cu ID %s nu a fost găsită în datele curente.", entry.entry_id)
     return False
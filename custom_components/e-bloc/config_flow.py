@@ -2,7 +2,7 @@ import logging
 from aiohttp import ClientSession
 from homeassistant import config_entries
 from homeassistant.core import callback
-from .const import DOMAIN, PAYLOAD_LOGIN, HEADERS_LOGIN, URL_LOGIN, PAYLOAD_LOGIN
+from .const import DOMAIN, PAYLOAD_LOGIN, HEADERS_LOGIN, URL_LOGIN, PAYLOAD_LOGIN, CONF_MEMORY_LEAN
 import voluptuous as vol
 
 _LOGGER = logging.getLogger(__name__)
@@ -10,7 +10,7 @@ _LOGGER = logging.getLogger(__name__)
 
 def mask_value(value):
     """Maschează valoarea, afișând doar primele 3 caractere."""
-    if not value or len(value) <= 3:
+    if not isinstance(value, str) or len(value) <= 3:
         return value
     return value[:3] + '*' * (len(value) - 3)
 
@@ -18,7 +18,7 @@ def mask_value(value):
 class EBlocConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Gestionarea fluxului de configurare pentru integrarea E-bloc."""
 
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(self, user_input=None):
         """Primul pas pentru configurarea utilizatorului."""
@@ -94,8 +94,15 @@ class EBlocOptionsFlow(config_entries.OptionsFlow):
             masked_input = {key: mask_value(value) for key, value in user_input.items()}
             _LOGGER.debug("Salvăm opțiunile actualizate: %s", masked_input)
 
-            self.hass.config_entries.async_update_entry(self.config_entry, data=user_input)
-            return self.async_create_entry(title="", data=user_input)
+            # Datele de autentificare rămân în `data`, opțiunile în `options`.
+            # O singură actualizare declanșează o singură reîncărcare;
+            # `async_create_entry` primește aceleași opțiuni și nu mai schimbă nimic.
+            data = dict(user_input)
+            options = {CONF_MEMORY_LEAN: data.pop(CONF_MEMORY_LEAN, False)}
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data={**self.config_entry.data, **data}, options=options
+            )
+            return self.async_create_entry(title="", data=options)
 
         # Preluăm datele curente din configurația inițială
         current_data = self.config_entry.data
@@ -105,11 +112,11 @@ class EBlocOptionsFlow(config_entries.OptionsFlow):
         # Afișăm formularul pentru configurare
         return self.async_show_form(
             step_id="init",
-            data_schema=self._get_options_schema(current_data),
+            data_schema=self._get_options_schema(current_data, self.config_entry.options),
             errors=errors,
         )
 
-    def _get_options_schema(self, current_data):
+    def _get_options_schema(self, current_data, current_options):
         """Schema formularului de opțiuni."""
         return vol.Schema(
             {
@@ -117,5 +124,6 @@ class EBlocOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional("pPass", default=current_data.get("pPass", "")): str,
                 vol.Optional("pIdAsoc", default=current_data.get("pIdAsoc", "")): str,
                 vol.Optional("pIdAp", default=current_data.get("pIdAp", "")): str,  # Adăugăm pIdAp în schema
+                vol.Optional(CONF_MEMORY_LEAN, default=current_options.get(CONF_MEMORY_LEAN, False)): bool,
             }
         )
\ No newline at end of file
@@ -1,34 +1,38 @@
-DOMAIN = "e-bloc"
+from datetime import timedelta
+
+# Constantele protocolului sunt definite în pachetul `ebloc`, independent de Home Assistant
+from .ebloc.const import (  # noqa: F401
+    URL_LOGIN,
+    URL_HOME,
+    URL_INDEX,
+    URL_RECEIPTS,
+    URL_LISTA_LUNI,
+    ENDPOINTS,
+    DEFAULT_USER,
+    DEFAULT_PASS,
+    DEFAULT_ID_ASOC,
+    DEFAULT_ID_AP,
+    PAYLOAD_LOGIN,
+    HEADERS_LOGIN,
+    HEADERS_POST,
+)
 
-# URL-uri
-URL_LOGIN = "https://www.e-bloc.ro/index.php"
-URL_HOME = "https://www.e-bloc.ro/ajax/AjaxGetHomeApInfo.php"
-URL_INDEX = "https://www.e-bloc.ro/ajax/AjaxGetIndexContoare.php"
-URL_RECEIPTS = "https://www.e-bloc.ro/ajax/AjaxGetPlatiChitanteToti.php"
-URL_LISTA_LUNI = "https://www.e-bloc.ro/ajax/AjaxGetIndexLuni.php"
+DOMAIN = "e-bloc"
 
-# Payload-uri implicite pentru autentificare și cereri POST
-DEFAULT_USER = ""
-DEFAULT_PASS = ""
-DEFAULT_ID_ASOC = ""
-DEFAULT_ID_AP = ""
+# Intervalul de actualizare
+SCAN_INTERVAL = timedelta(minutes=5)
 
-PAYLOAD_LOGIN = {
-    "pUser": DEFAULT_USER,
-    "pPass": DEFAULT_PASS,
-    "pIdAsoc": DEFAULT_ID_ASOC,
-    "pIdAp": DEFAULT_ID_AP,
-}
+# Opțiune: nu păstrează răspunsurile brute după procesare
+CONF_MEMORY_LEAN = "memory_lean"
 
-# Anteturi pentru cererile HTTP
-HEADERS_LOGIN = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
-    "Referer": URL_LOGIN,
-}
+# Serviciul de reîmprospătare la cerere
+SERVICE_REFRESH = "refresh"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_APARTMENT = "apartment"
+ATTR_ENDPOINTS = "endpoints"
+REFRESH_COOLDOWN = 2  # secunde în care apelurile succesive sunt grupate
 
-HEADERS_POST = {
-    "Accept": "application/json, text/javascript, */*; q=0.01",
-    "Content-Type": "application/x-www-form-urlencoded",
-    "Referer": "https://www.e-bloc.ro/index.php?page=19&t=1735328869",
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
-}
\ No newline at end of file
+# Serviciile de înregistrare a traficului HTTP (vezi `ebloc.replay`)
+SERVICE_START_RECORDING = "start_recording"
+SERVICE_STOP_RECORDING = "stop_recording"
+RECORDINGS_DIR = "e-bloc/recordings"  # relativ la directorul de configurare
@@ -0,0 +1,124 @@
+import logging
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .ebloc.client import EBlocClient, EBlocError, compact_data
+from .ebloc.replay import RecordingSession
+from .const import (
+    ENDPOINTS,
+    REFRESH_COOLDOWN,
+    SCAN_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EBlocDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordonator pentru actualizarea datelor în integrarea E-bloc."""
+
+    def __init__(self, hass, config, session=None, memory_lean=False):
+        """Inițializare coordonator.
+
+        `session` permite injectarea unui transport HTTP propriu, de exemplu
+        `RecordingSession` sau `ReplaySession` din `ebloc.replay`.
+        `memory_lean` vine din opțiunile intrării, nu din `config`.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="EBlocDataUpdateCoordinator",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.hass = hass
+        self.config = config
+        self.client = EBlocClient.from_config(config, session=session)
+        self.memory_lean = memory_lean
+        # Endpoint-urile cerute prin serviciu, grupate până la expirarea debouncer-ului
+        self._pending_endpoints = set()
+        self._endpoints_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_pending_endpoints,
+        )
+
+    async def _async_update_data(self):
+        """Actualizează datele pentru toate componentele."""
+        try:
+            return self._process(await self.client.fetch_endpoints())
+        except EBlocError as e:
+            raise UpdateFailed(str(e))
+        except Exception as e:
+            raise UpdateFailed(f"Eroare la actualizarea datelor: {e}")
+
+    def _process(self, data):
+        """În modul economic, renunță la răspunsurile brute după procesare."""
+        return compact_data(data) if self.memory_lean else data
+
+    async def async_request_endpoints_refresh(self, endpoints=None):
+        """Programează reîmprospătarea endpoint-urilor cerute (cu debounce)."""
+        self._pending_endpoints.update(endpoints or ENDPOINTS)
+        await self._endpoints_debouncer.async_call()
+
+    async def _async_refresh_pending_endpoints(self):
+        """Execută o singură reîmprospătare pentru toate endpoint-urile acumulate."""
+        endpoints, self._pending_endpoints = self._pending_endpoints, set()
+        if not endpoints:
+            return
+
+        if self.data is None or endpoints >= set(ENDPOINTS):
+            _LOGGER.debug("Reîmprospătare completă la cerere.")
+            await self.async_refresh()
+            return
+
+        _LOGGER.debug("Reîmprospătare la cerere pentru: %s", sorted(endpoints))
+        try:
+            updated = self._process(
+                await self.client.fetch_endpoints(
+                    endpoints, self.data.get("luna_activa"), skip_failed=True
+                )
+            )
+        except Exception as e:
+            _LOGGER.error("Eroare la reîmprospătarea la cerere: %s", e)
+            return
+
+        if not updated:
+            return
+
+        # Cheile care au eșuat lipsesc din `updated`, deci datele anterioare rămân
+        self.async_set_updated_data({**self.data, **updated})
+
+    def async_cancel_pending_refresh(self):
+        """Anulează reîmprospătările la cerere care nu au rulat încă."""
+        self._pending_endpoints.clear()
+        self._endpoints_debouncer.async_cancel()
+
+    @property
+    def recording(self):
+        """Dacă cererile HTTP ale clientului sunt înregistrate."""
+        return isinstance(self.client.session, RecordingSession)
+
+    def async_start_recording(self):
+        """Începe înregistrarea cererilor HTTP (utilizatorul și parola sunt mascate)."""
+        if self.recording:
+            return
+        self.client.session = RecordingSession(
+            self.client.ensure_session(),
+            secrets=(self.config["pUser"], self.config["pPass"]),
+        )
+        _LOGGER.debug("Înregistrarea cererilor a început.")
+
+    async def async_stop_recording(self, path):
+        """Oprește înregistrarea și salvează cererile în `path`; returnează numărul lor."""
+        if not self.recording:
+            return None
+        recorder = self.client.session
+        self.client.session = recorder.session
+        await self.hass.async_add_executor_job(recorder.save, path)
+        _LOGGER.debug("Au fost salvate %s cereri în %s", len(recorder.exchanges), path)
+        return len(recorder.exchanges)
+
+    async def async_close(self):
+        """Închide sesiunea HTTP a clientului."""
+        await self.client.close()
@@ -0,0 +1,15 @@
+"""Client e-bloc.ro și utilitare (export, înregistrare/redare, benchmark).
+
+Pachetul nu depinde de Home Assistant. Utilitarele se rulează din
+directorul integrării, de exemplu:
+
+    cd custom_components/e-bloc
+    python -m ebloc.export conturi.json --format csv -o export.csv
+"""
+from .client import (  # noqa: F401
+    EBlocAuthError,
+    EBlocClient,
+    EBlocError,
+    compact_data,
+    get_luna_activa,
+)
@@ -0,0 +1,127 @@
+"""Benchmark de memorie: costul per intrare al datelor păstrate de coordonator.
+
+Compară datele brute (modul implicit) cu cele compacte (modul economic,
+`memory_lean`). Se măsoară doar datele coordonatorului, nu și cei șase senzori
+ai fiecărei intrări. Rulează independent de Home Assistant, din directorul integrării:
+
+    cd custom_components/e-bloc
+    python -m ebloc.benchmark --entries 500
+    python -m ebloc.benchmark --entries 500 --bundle bundle.json
+
+Cu `--bundle`, răspunsurile sunt luate dintr-o înregistrare făcută cu
+`ebloc.replay`; altfel se folosesc răspunsuri sintetice de dimensiuni realiste.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+
+from .client import compact_data, get_luna_activa
+from .const import ENDPOINTS
+
+
+def synthetic_bodies():
+    """Răspunsuri sintetice, ca text JSON, pentru fiecare endpoint."""
+    lista_luni = {
+        str(i): {"luna": f"{2024 - i // 12}-{12 - i % 12:02d}", "open": "1" if i == 0 else "0", "titlu": f"Luna {i}"}
+        for i in range(36)
+    }
+    home = {"1": {f"camp_{i}": f"valoare {i}" for i in range(30)}}
+    home["1"].update({
+        "cod_client": "A12345F",
+        "ap": "22",
+        "nr_pers_afisat": "2",
+        "datorie": "22175",
+        "ultima_zi_plata": "2025-01-12",
+        "contoare_citite": "0",
+        "citire_contoare_start": "2024-12-20",
+        "citire_contoare_end": "2024-12-25",
+        "luna_veche": "2024-11",
+        "nivel_restanta": "0",
+    })
+    index = {
+        str(key): {
+            "index_vechi": "79344",
+            "index_nou": "80258",
+            "titlu": f"Contor {key}",
+            "serie": "SN-000123",
+            "tip": "apa",
+            "data_citire": "2024-12-21",
+            "observatii": "",
+            "locatie": "Baie",
+        }
+        for key in range(2, 6)
+    }
+    receipts = {
+        str(i): {
+            "numar": f"43{i:010d}",
+            "data": "2024-11-27",
+            "suma": "26251",
+            "tip_plata": "card",
+            "operator": "online",
+            "detalii": "Plata intretinere",
+        }
+        for i in range(24)
+    }
+    return {
+        "lista_luni": json.dumps(lista_luni),
+        "home": json.dumps(home),
+        "index": json.dumps(index),
+        "receipts": json.dumps(receipts),
+    }
+
+
+def bundle_bodies(path):
+    """Ultimul răspuns înregistrat pentru fiecare endpoint dintr-o înregistrare `ebloc.replay`."""
+    urls = {url: endpoint for endpoint, url in ENDPOINTS.items()}
+    with open(path, encoding="utf-8") as f:
+        bundle = json.load(f)
+    bodies = {}
+    for exchange in bundle["exchanges"]:
+        endpoint = urls.get(exchange["url"])
+        if endpoint and exchange.get("body"):
+            bodies[endpoint] = exchange["body"]
+    missing = set(ENDPOINTS) - set(bodies)
+    if missing:
+        raise SystemExit(f"Înregistrarea nu conține răspunsuri pentru: {', '.join(sorted(missing))}")
+    return bodies
+
+
+def build_entry(bodies, lean):
+    """Reconstruiește datele unei intrări așa cum le păstrează coordonatorul."""
+    data = {endpoint: json.loads(body) for endpoint, body in bodies.items()}
+    data["luna_activa"] = get_luna_activa(data["lista_luni"])
+    return compact_data(data) if lean else data
+
+
+def measure(bodies, entries, lean):
+    """Returnează memoria (octeți) reținută pentru `entries` intrări."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build_entry(bodies, lean) for _ in range(entries)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ebloc.benchmark", description="Benchmark de memorie per intrare e-bloc.")
+    parser.add_argument("-n", "--entries", type=int, default=200, help="Numărul de intrări simulate.")
+    parser.add_argument("-b", "--bundle", help="Înregistrare `ebloc.replay` folosită ca sursă a răspunsurilor.")
+    args = parser.parse_args(argv)
+
+    bodies = bundle_bodies(args.bundle) if args.bundle else synthetic_bodies()
+    raw = measure(bodies, args.entries, lean=False)
+    lean = measure(bodies, args.entries, lean=True)
+
+    print(f"Intrări: {args.entries} (doar datele coordonatorului, fără senzori)")
+    print(f"Implicit:  {raw / args.entries / 1024:8.1f} KiB/intrare  ({raw / 1024 / 1024:.2f} MiB total)")
+    print(f"Economic:  {lean / args.entries / 1024:8.1f} KiB/intrare  ({lean / 1024 / 1024:.2f} MiB total)")
+    if raw:
+        print(f"Reducere:  {100 * (raw - lean) / raw:8.1f} %")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Client asincron pentru e-bloc.ro, independent de Home Assistant."""
+import logging
+from aiohttp import ClientSession
+
+from .const import (
+    URL_LOGIN,
+    URL_HOME,
+    URL_INDEX,
+    URL_RECEIPTS,
+    URL_LISTA_LUNI,
+    HEADERS_LOGIN,
+    HEADERS_POST,
+    ENDPOINTS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EBlocError(Exception):
+    """Eroare generică pentru comunicarea cu e-bloc.ro."""
+
+
+class EBlocAuthError(EBlocError):
+    """Autentificarea pe e-bloc.ro a eșuat."""
+
+
+def get_luna_activa(lista_luni):
+    """Returnează luna activă din primele trei luni ale listei `lista_luni`."""
+    _LOGGER.debug("Get_luna_activa lista_luni: %s", lista_luni)
+    first_three_months = {k: lista_luni[k] for k in list(lista_luni.keys())[:3]}
+    _LOGGER.debug("Get_luna_activa first_three_months: %s", first_three_months)
+    luna_activa = next((v['luna'] for k, v in first_three_months.items() if v['open'] == '0'), None)
+    _LOGGER.debug("Get_luna_activa luna_activa: %s", luna_activa)
+    return luna_activa if luna_activa else list(first_three_months.values())[0]['luna']
+
+
+# Câmpurile folosite de senzori; restul răspunsului nu este păstrat în modul economic
+HOME_FIELDS = (
+    "cod_client",
+    "ap",
+    "nr_pers_afisat",
+    "datorie",
+    "ultima_zi_plata",
+    "contoare_citite",
+    "citire_contoare_start",
+    "citire_contoare_end",
+    "luna_veche",
+    "nivel_restanta",
+)
+INDEX_FIELDS = ("index_vechi", "index_nou")
+RECEIPT_FIELDS = ("numar", "data", "suma")
+
+
+def _compact_records(records, fields):
+    return {
+        key: {field: value[field] for field in fields if field in value}
+        for key, value in (records or {}).items()
+        if isinstance(value, dict)
+    }
+
+
+def compact_data(data):
+    """Păstrează din răspunsurile brute doar câmpurile folosite de senzori.
+
+    Structura rezultată este aceeași (chei și dicționare), deci senzorii o
+    citesc la fel; `lista_luni` este eliminată după calculul lunii active.
+    """
+    compact = {key: value for key, value in data.items() if key == "luna_activa"}
+    if "home" in data:
+        compact["home"] = _compact_records(data["home"], HOME_FIELDS)
+    if "index" in data:
+        compact["index"] = _compact_records(data["index"], INDEX_FIELDS)
+    if "receipts" in data:
+        compact["receipts"] = _compact_records(data["receipts"], RECEIPT_FIELDS)
+    return compact
+
+
+class EBlocClient:
+    """Client pentru un singur apartament de pe e-bloc.ro.
+
+    Fiecare client are propria sesiune HTTP (și deci propriul cookie de
+    autentificare), astfel încât mai multe conturi pot rula în paralel.
+    """
+
+    def __init__(self, user, password, id_asoc, id_ap, session=None, strict=False):
+        """Inițializare client.
+
+        În modul `strict`, cererile eșuate ridică `EBlocError` în loc să
+        returneze `{}` (comportamentul tolerant folosit de coordonator).
+        """
+        self.user = user
+        self.password = password
+        self.id_asoc = id_asoc
+        self.id_ap = id_ap
+        self.session = session
+        self.strict = strict
+        self.authenticated = False
+        self._owns_session = session is None
+
+    @classmethod
+    def from_config(cls, config, **kwargs):
+        """Creează clientul dintr-un dicționar cu cheile `pUser`, `pPass`, `pIdAsoc`, `pIdAp`."""
+        return cls(config["pUser"], config["pPass"], config["pIdAsoc"], config["pIdAp"], **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Închide sesiunea HTTP, dacă a fost creată de client."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+        self.authenticated = False
+
+    def ensure_session(self):
+        """Returnează sesiunea HTTP, creând-o la nevoie."""
+        if self.session is None:
+            self.session = ClientSession()
+            self._owns_session = True
+        return self.session
+
+    async def authenticate(self):
+        """Autentificare pe server."""
+        session = self.ensure_session()
+        payload = {"pUser": self.user, "pPass": self.password}
+        try:
+            async with session.post(URL_LOGIN, data=payload, headers=HEADERS_LOGIN) as response:
+                if response.status == 200 and "Acces online proprietari" in await response.text():
+                    _LOGGER.debug("Autentificare reușită.")
+                    self.authenticated = True
+                    return
+        except Exception as e:
+            raise EBlocAuthError(f"Eroare la autentificare: {e}") from e
+        raise EBlocAuthError("Autentificare eșuată.")
+
+    async def _ensure_authenticated(self):
+        if not self.authenticated:
+            await self.authenticate()
+
+    async def fetch(self, url, luna=None, strict=None):
+        """Execută cererea POST pentru apartament și returnează răspunsul JSON.
+
+        `strict` suprascrie, doar pentru această cerere, modul clientului.
+        """
+        await self._ensure_authenticated()
+        payload = {"pIdAsoc": self.id_asoc, "pIdAp": self.id_ap}
+        if luna is not None:
+            payload["pLuna"] = luna
+        return await self._fetch_data(url, payload, self.strict if strict is None else strict)
+
+    async def _fetch_data(self, url, payload, strict=False):
+        """Execută cererea POST și returnează răspunsul JSON."""
+        try:
+            async with self.session.post(url, data=payload, headers=HEADERS_POST) as response:
+                if response.status == 200:
+                    return await response.json()
+                message = f"Eroare la accesarea {url}: Status {response.status}"
+        except Exception as e:
+            message = f"Eroare la conexiunea cu serverul: {e}"
+
+        if strict:
+            raise EBlocError(message)
+        _LOGGER.error(message)
+        return {}
+
+    async def get_lista_luni(self):
+        """Lista lunilor disponibile (`AjaxGetIndexLuni.php`)."""
+        return await self.fetch(URL_LISTA_LUNI)
+
+    async def get_home(self, luna):
+        """Informațiile despre apartament (`AjaxGetHomeApInfo.php`)."""
+        return await self.fetch(URL_HOME, luna)
+
+    async def get_index(self, luna):
+        """Indexurile contoarelor pentru luna dată (`AjaxGetIndexContoare.php`)."""
+        return await self.fetch(URL_INDEX, luna)
+
+    async def get_receipts(self, luna):
+        """Plățile și chitanțele (`AjaxGetPlatiChitanteToti.php`)."""
+        return await self.fetch(URL_RECEIPTS, luna)
+
+    async def fetch_endpoints(self, endpoints=None, luna_activa=None, skip_failed=False):
+        """Descarcă doar endpoint-urile cerute și returnează cheile actualizate.
+
+        Dacă `lista_luni` e cerută (sau luna activă nu e cunoscută) și luna
+        activă s-a schimbat, sunt descărcate toate endpoint-urile. Cu
+        `skip_failed`, endpoint-urile care eșuează lipsesc din rezultat (în
+        loc de `{}`), astfel încât datele anterioare pot fi păstrate. La
+        schimbarea lunii, datele anterioare ar aparține altei luni, deci orice
+        eșec ridică `EBlocError`.
+        """
+        endpoints = set(endpoints or ENDPOINTS)
+        strict = True if skip_failed else None
+        data = {}
+        if "lista_luni" in endpoints or luna_activa is None:
+            try:
+                lista_luni = await self.fetch(URL_LISTA_LUNI, strict=strict)
+            except EBlocError as e:
+                if luna_activa is None:
+                    raise
+                _LOGGER.warning("Endpoint-ul lista_luni nu a putut fi reîmprospătat: %s", e)
+                lista_luni = None
+
+            if lista_luni is not None:
+                _LOGGER.debug("fetch_endpoints lista_luni: %s", lista_luni)
+
+                luna_nou = get_luna_activa(lista_luni)
+                _LOGGER.debug("fetch_endpoints luna_activa: %s", luna_nou)
+
+                # Dacă luna activă s-a schimbat, restul datelor nu mai corespund lunii
+                if luna_activa is not None and luna_nou != luna_activa:
+                    endpoints = set(ENDPOINTS)
+                    skip_failed = False
+                luna_activa = luna_nou
+                data["lista_luni"] = lista_luni
+                data["luna_activa"] = luna_activa
+
+        _LOGGER.debug("Using luna_activa: %s", luna_activa)
+
+        for endpoint in ("home", "index", "receipts"):
+            if endpoint in endpoints:
+                try:
+                    data[endpoint] = await self.fetch(ENDPOINTS[endpoint], luna_activa, strict=strict)
+                except EBlocError as e:
+                    if not skip_failed:
+                        raise
+                    _LOGGER.warning("Endpoint-ul %s nu a putut fi reîmprospătat: %s", endpoint, e)
+        return data
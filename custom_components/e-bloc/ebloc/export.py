@@ -0,0 +1,166 @@
+"""Export în masă al istoricului de indexuri și al chitanțelor de pe e-bloc.ro.
+
+Rulează independent de Home Assistant, din directorul integrării:
+
+    cd custom_components/e-bloc
+    python -m ebloc.export conturi.json --format csv -o export.csv
+
+Fișierul de conturi este o listă JSON de obiecte cu aceleași chei ca
+intrarea de configurare: `pUser`, `pPass`, `pIdAsoc`, `pIdAp`.
+Rândurile sunt scrise cont cu cont, fără a păstra tot exportul în memorie.
+Un cont pentru care o cerere eșuează nu este scris deloc și este raportat
+la final (cod de ieșire 1).
+"""
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import sys
+
+from .client import EBlocClient, EBlocError, get_luna_activa
+
+_LOGGER = logging.getLogger(__name__)
+
+CSV_FIELDS = [
+    "asociatie",
+    "apartament",
+    "tip",
+    "luna",
+    "id",
+    "index_vechi",
+    "index_nou",
+    "numar",
+    "data",
+    "suma",
+]
+
+# Numărul maxim de rânduri în așteptare înainte ca descărcările să fie blocate
+QUEUE_SIZE = 1000
+
+
+def _rows(asociatie, apartament, tip, luna, data):
+    """Transformă un răspuns JSON (dicționar de înregistrări) în rânduri de export."""
+    for key, value in (data or {}).items():
+        if isinstance(value, dict):
+            yield {
+                **value,
+                "asociatie": asociatie,
+                "apartament": apartament,
+                "tip": tip,
+                "luna": luna,
+                "id": key,
+            }
+
+
+async def export_account(account, queue, months=None):
+    """Descarcă istoricul de indexuri și chitanțele unui cont și le pune în coadă.
+
+    Rândurile contului sunt puse în coadă doar după ce toate cererile au
+    reușit, astfel încât un cont eșuat nu apare parțial în export.
+    """
+    rows = []
+    async with EBlocClient.from_config(account, strict=True) as client:
+        lista_luni = await client.get_lista_luni()
+        if not lista_luni:
+            raise EBlocError("Lista lunilor este goală.")
+
+        luni = [v["luna"] for v in lista_luni.values() if isinstance(v, dict) and "luna" in v]
+        if months is not None:
+            luni = luni[:months]
+
+        for luna in luni:
+            rows.extend(_rows(client.id_asoc, client.id_ap, "index", luna, await client.get_index(luna)))
+
+        luna_activa = get_luna_activa(lista_luni)
+        rows.extend(_rows(client.id_asoc, client.id_ap, "chitanta", luna_activa, await client.get_receipts(luna_activa)))
+
+    for row in rows:
+        await queue.put(row)
+
+
+async def _worker(accounts, queue, months, failures):
+    for account in accounts:
+        try:
+            await export_account(account, queue, months)
+        except Exception as e:
+            _LOGGER.error("Export eșuat pentru apartamentul %s: %s", account.get("pIdAp"), e)
+            failures.append(account)
+
+
+async def _writer(queue, output, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(row):
+            output.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    while True:
+        row = await queue.get()
+        if row is None:
+            break
+        write(row)
+    output.flush()
+
+
+async def export_accounts(accounts, output, fmt="jsonl", concurrency=4, months=None):
+    """Exportă conturile cu cel mult `concurrency` conturi procesate în paralel.
+
+    Returnează lista conturilor pentru care exportul a eșuat.
+    """
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    failures = []
+    writer = asyncio.create_task(_writer(queue, output, fmt))
+
+    # Toți workerii consumă același iterator, deci fiecare cont e procesat o singură dată
+    accounts = iter(accounts)
+    workers = asyncio.gather(
+        *(_worker(accounts, queue, months, failures) for _ in range(max(1, concurrency)))
+    )
+
+    await asyncio.wait({writer, workers}, return_when=asyncio.FIRST_COMPLETED)
+    if writer.done():
+        # Scriitorul se oprește doar cu o eroare; fără el, workerii ar rămâne blocați în `queue.put`
+        workers.cancel()
+        await asyncio.gather(workers, return_exceptions=True)
+        writer.result()
+
+    await queue.put(None)
+    await writer
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ebloc.export", description="Export indexuri și chitanțe de pe e-bloc.ro.")
+    parser.add_argument("accounts", help="Fișier JSON cu lista de conturi (pUser, pPass, pIdAsoc, pIdAp).")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], default="jsonl", help="Formatul de ieșire.")
+    parser.add_argument("-o", "--output", help="Fișierul de ieșire (implicit stdout).")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="Numărul maxim de conturi procesate în paralel.")
+    parser.add_argument("-m", "--months", type=int, help="Numărul maxim de luni exportate per cont (cele mai recente).")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Afișează mesajele de debug.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    with open(args.accounts, encoding="utf-8") as f:
+        accounts = json.load(f)
+
+    output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        failures = asyncio.run(
+            export_accounts(accounts, output, args.format, args.concurrency, args.months)
+        )
+    except OSError as e:
+        _LOGGER.error("Eroare la scrierea exportului: %s", e)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""Înregistrarea și redarea traficului HTTP către e-bloc.ro.
+
+`RecordingSession` învelește o sesiune `aiohttp` și salvează perechile
+cerere/răspuns (cu acreditările mascate) într-un fișier JSON.
+`ReplaySession` redă un astfel de fișier, cu timpii înregistrați (pauza
+dinaintea fiecărei cereri și durata ei), și poate fi injectată în `EBlocClient` sau `EBlocDataUpdateCoordinator` (parametrul
+`session`) pentru rulări deterministe, fără acces la site.
+
+Rulează independent de Home Assistant, din directorul integrării:
+
+    cd custom_components/e-bloc
+    python -m ebloc.replay record cont.json bundle.json
+    python -m ebloc.replay replay cont.json bundle.json --runs 50
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from .client import EBlocClient, EBlocError
+
+_LOGGER = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+MASK = "***"
+CREDENTIAL_KEYS = ("pUser", "pPass")
+
+
+# Secretele mai scurte sunt mascate doar ca token separat, nu ca subșir, ca
+# să nu fie alterate indexuri, sume sau date care le conțin
+MIN_SECRET_LENGTH = 6
+
+
+def _mask_string(text, secrets):
+    # Secretele lungi întâi, ca un secret scurt conținut în ele să nu le strice
+    for secret in sorted(secrets, key=len, reverse=True):
+        if len(secret) >= MIN_SECRET_LENGTH:
+            text = text.replace(secret, MASK)
+        else:
+            text = re.sub(rf"(?<!\w){re.escape(secret)}(?!\w)", MASK, text)
+    return text
+
+
+def _mask_json_values(value, secrets):
+    if isinstance(value, dict):
+        return {key: _mask_json_values(item, secrets) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_mask_json_values(item, secrets) for item in value]
+    if isinstance(value, str):
+        return _mask_string(value, secrets)
+    return value
+
+
+def mask_secrets(text, secrets, url=None):
+    """Maschează valorile secrete din corpul unui răspuns.
+
+    Secretele de cel puțin `MIN_SECRET_LENGTH` caractere sunt mascate oriunde
+    apar, cele mai scurte doar ca token separat (nu în interiorul altor
+    cuvinte sau numere). În corpurile JSON sunt mascate doar valorile text,
+    iar orice modificare este semnalată în log.
+    """
+    secrets = {secret for secret in secrets if secret}
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return _mask_string(text, secrets)
+
+    masked = _mask_json_values(parsed, secrets)
+    if masked == parsed:
+        return text
+    _LOGGER.warning("Au fost mascate valori din răspunsul JSON pentru %s", url)
+    return json.dumps(masked, ensure_ascii=False)
+
+
+class _RecordingResponse:
+    """Context pentru o cerere înregistrată; deleagă către răspunsul real."""
+
+    def __init__(self, recorder, url, payload, request_context):
+        self._recorder = recorder
+        self._url = url
+        self._payload = payload
+        self._request_context = request_context
+        self._response = None
+        self._started = None
+
+    async def __aenter__(self):
+        self._started = time.monotonic()
+        self._response = await self._request_context.__aenter__()
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        try:
+            body = await self._response.text()
+        except Exception:
+            body = None
+        self._recorder._record(
+            self._url,
+            self._payload,
+            self._response.status,
+            body,
+            self._started,
+            time.monotonic() - self._started,
+        )
+        return await self._request_context.__aexit__(*exc_info)
+
+
+class RecordingSession:
+    """Învelește o sesiune `aiohttp` și înregistrează toate cererile POST."""
+
+    def __init__(self, session, secrets=()):
+        """`secrets` sunt valori (ex. utilizator, parolă) mascate și în corpul răspunsurilor."""
+        self.session = session
+        self.secrets = {s for s in secrets if s}
+        self.exchanges = []
+        self._start = time.monotonic()
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        payload = dict(data or {})
+        for key in CREDENTIAL_KEYS:
+            if payload.get(key):
+                self.secrets.add(payload[key])
+        return _RecordingResponse(self, url, payload, self.session.post(url, data=data, headers=headers, **kwargs))
+
+    def _record(self, url, payload, status, body, started, duration):
+        masked_payload = {
+            key: MASK if key in CREDENTIAL_KEYS else value for key, value in payload.items()
+        }
+        self.exchanges.append({
+            "method": "POST",
+            "url": url,
+            "payload": masked_payload,
+            "status": status,
+            "body": mask_secrets(body, self.secrets, url) if body is not None else None,
+            "offset": round(started - self._start, 6),
+            "duration": round(duration, 6),
+        })
+
+    def bundle(self):
+        """Returnează înregistrarea ca dicționar serializabil JSON."""
+        return {
+            "version": BUNDLE_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "exchanges": self.exchanges,
+        }
+
+    def save(self, path):
+        """Salvează înregistrarea într-un fișier JSON."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.bundle(), f, ensure_ascii=False, indent=2)
+
+    async def close(self):
+        await self.session.close()
+
+
+class ReplayResponse:
+    """Răspuns redat dintr-o înregistrare, cu interfața folosită de `EBlocClient`."""
+
+    def __init__(self, exchange, speed, gap=0):
+        self.status = exchange["status"]
+        self._body = exchange["body"] or ""
+        self._delay = (gap + exchange.get("duration", 0)) * speed
+
+    async def __aenter__(self):
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self._body
+
+    async def json(self):
+        return json.loads(self._body)
+
+
+class ReplaySession:
+    """Redă răspunsurile înregistrate, în ordine, pentru fiecare URL.
+
+    `speed` scalează timpii înregistrați (1 = timpii reali, 0 = fără
+    așteptare): înaintea fiecărui răspuns se așteaptă pauza dintre sfârșitul
+    cererii anterioare și începutul ei (din `offset`), plus durata ei. Pauza
+    dinaintea primei cereri nu este redată. Cu `loop=True` înregistrarea este
+    reluată de la capăt, util pentru rulări repetate ale aceluiași ciclu de
+    actualizare.
+    """
+
+    def __init__(self, bundle, speed=1.0, loop=True):
+        if bundle.get("version") != BUNDLE_VERSION:
+            raise EBlocError(f"Versiune necunoscută a înregistrării: {bundle.get('version')}")
+        self.speed = speed
+        self.loop = loop
+        self._exchanges = defaultdict(list)
+        previous_end = None
+        for exchange in bundle["exchanges"]:
+            offset = exchange.get("offset")
+            gap = 0
+            if offset is not None:
+                if previous_end is not None:
+                    gap = max(0, offset - previous_end)
+                previous_end = offset + exchange.get("duration", 0)
+            self._exchanges[exchange["url"]].append((exchange, gap))
+        self._positions = defaultdict(int)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Încarcă o înregistrare salvată cu `RecordingSession.save`."""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), **kwargs)
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        exchanges = self._exchanges.get(url)
+        if not exchanges:
+            raise EBlocError(f"Nicio cerere înregistrată pentru {url}")
+
+        position = self._positions[url]
+        if position >= len(exchanges):
+            if not self.loop:
+                raise EBlocError(f"Înregistrarea pentru {url} a fost epuizată")
+            position = 0
+        self._positions[url] = position + 1
+        exchange, gap = exchanges[position]
+        return ReplayResponse(exchange, self.speed, gap)
+
+    async def close(self):
+        pass
+
+
+async def record(config, path):
+    """Execută un ciclu complet de actualizare și îl salvează în `path`."""
+    from aiohttp import ClientSession
+
+    session = RecordingSession(ClientSession(), secrets=(config["pUser"], config["pPass"]))
+    try:
+        await EBlocClient.from_config(config, session=session).fetch_endpoints()
+    finally:
+        await session.close()
+    session.save(path)
+    return len(session.exchanges)
+
+
+async def replay(config, path, runs=1, speed=1.0):
+    """Redă ciclul de actualizare de `runs` ori și returnează duratele (secunde)."""
+    session = ReplaySession.load(path, speed=speed)
+    client = EBlocClient.from_config(config, session=session)
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await client.fetch_endpoints()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ebloc.replay", description="Înregistrare și redare trafic e-bloc.ro.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Înregistrează un ciclu de actualizare.")
+    record_parser.add_argument("account", help="Fișier JSON cu contul (pUser, pPass, pIdAsoc, pIdAp).")
+    record_parser.add_argument("bundle", help="Fișierul în care se salvează înregistrarea.")
+
+    replay_parser = subparsers.add_parser("replay", help="Redă o înregistrare.")
+    replay_parser.add_argument("account", help="Fișier JSON cu contul (pIdAsoc, pIdAp; acreditările pot lipsi).")
+    replay_parser.add_argument("bundle", help="Fișierul cu înregistrarea.")
+    replay_parser.add_argument("-n", "--runs", type=int, default=1, help="Numărul de cicluri redate.")
+    replay_parser.add_argument("-s", "--speed", type=float, default=1.0, help="Factor pentru timpii înregistrați (0 = fără așteptare).")
+
+    parser.add_argument("-v", "--verbose", action="store_true", help="Afișează mesajele de debug.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    with open(args.account, encoding="utf-8") as f:
+        config = json.load(f)
+
+    if args.command == "record":
+        count = asyncio.run(record(config, args.bundle))
+        print(f"{count} cereri înregistrate în {args.bundle}")
+        return 0
+
+    config = {"pUser": MASK, "pPass": MASK, **config}
+    durations = asyncio.run(replay(config, args.bundle, args.runs, args.speed))
+    total = sum(durations)
+    print(
+        f"{len(durations)} cicluri: total {total:.4f}s, "
+        f"medie {total / len(durations):.4f}s, min {min(durations):.4f}s, max {max(durations):.4f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,157 +1,107 @@
 import logging
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-from aiohttp import ClientSession
+from types import MappingProxyType
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.device_registry import DeviceEntryType
-
-from .const import (
-    DOMAIN,
-    URL_LOGIN,
-    HEADERS_LOGIN,
-    HEADERS_POST,
-    URL_HOME,
-    URL_INDEX,
-    URL_RECEIPTS,
-    URL_LISTA_LUNI,
-)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-_LOGGER = logging.getLogger(__name__)
+from .const import DOMAIN
 
-SCAN_INTERVAL = timedelta(minutes=5)
+_LOGGER = logging.getLogger(__name__)
 
-class EBlocDataUpdateCoordinator(DataUpdateCoordinator):
-    """Coordonator pentru actualizarea datelor în integrarea E-bloc."""
 
-    def __init__(self, hass, config):
-        """Inițializare coordonator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="EBlocDataUpdateCoordinator",
-            update_interval=SCAN_INTERVAL,
+def build_device_info(entry_id):
+    """Descriptorul (imuabil) al dispozitivului unei intrări, comun senzorilor ei."""
+    return MappingProxyType(
+        DeviceInfo(
+            identifiers=frozenset({(DOMAIN, entry_id)}),
+            name="Interfață UI pentru E-bloc.ro",
+            manufacturer="E-bloc.ro",
+            model="Interfață UI pentru E-bloc.ro",
+            entry_type=DeviceEntryType.SERVICE,
         )
-        self.hass = hass
-        self.config = config
-        self.session = None
-        self.authenticated = False
-    
-    def _get_luna_activa(self, lista_luni):
-        _LOGGER.debug("Get_luna_activa lista_luni: %s", lista_luni)
-        first_three_months = {k: lista_luni[k] for k in list(lista_luni.keys())[:3]}
-        _LOGGER.debug("Get_luna_activa first_three_months: %s", first_three_months)        
-        luna_activa = next((v['luna'] for k, v in first_three_months.items() if v['open'] == '0'), None)
-        _LOGGER.debug("Get_luna_activa luna_activa: %s", luna_activa)                
-        return luna_activa if luna_activa else list(first_three_months.values())[0]['luna']
-    
-    async def _async_update_data(self):
-        """Actualizează datele pentru toate componentele."""
-        try:
-            if not self.session:
-                self.session = ClientSession()
-            if not self.authenticated:
-                await self._authenticate()
-
-            initial_payload = {
-                "pIdAsoc": self.config["pIdAsoc"],
-                "pIdAp": self.config["pIdAp"]
-            }
-            
-            lista_luni = await self._fetch_data(URL_LISTA_LUNI, initial_payload)
-            _LOGGER.debug("_async_update_data lista_luni: %s", lista_luni)                
-        
-            luna_activa = self._get_luna_activa(lista_luni)
-            _LOGGER.debug("_async_update_data lista_luni: %s", luna_activa)                
-
-            payload = {
-                "pIdAsoc": self.config["pIdAsoc"],
-                "pIdAp": self.config["pIdAp"],
-                "pLuna": luna_activa
-            }
-
-            _LOGGER.debug("Using payload with luna_activa: %s", payload)
-
-            return {
-                "home": await self._fetch_data(URL_HOME, payload),
-                "index": await self._fetch_data(URL_INDEX, payload),
-                "receipts": await self._fetch_data(URL_RECEIPTS, payload),
-                "lista_luni": lista_luni,
-                "luna_activa": luna_activa
-            }
-        except Exception as e:
-            raise UpdateFailed(f"Eroare la actualizarea datelor: {e}")
-
-    async def _authenticate(self):
-        """Autentificare pe server."""
-        payload = {"pUser": self.config["pUser"], "pPass": self.config["pPass"]}
-        try:
-            async with self.session.post(URL_LOGIN, data=payload, headers=HEADERS_LOGIN) as response:
-                if response.status == 200 and "Acces online proprietari" in await response.text():
-                    _LOGGER.debug("Autentificare reușită.")
-                    self.authenticated = True
-                else:
-                    raise UpdateFailed("Autentificare eșuată.")
-        except Exception as e:
-            raise UpdateFailed(f"Eroare la autentificare: {e}")
-
-    async def _fetch_data(self, url, payload):
-        """Execută cererea POST și returnează răspunsul JSON."""
-        try:
-            async with self.session.post(url, data=payload, headers=HEADERS_POST) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("Eroare la accesarea %s: Status %s", url, response.status)
-                    return {}
-        except Exception as e:
-            _LOGGER.error("Eroare la conexiunea cu serverul: %s", e)
-            return {}
+    )
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Setăm senzorii pentru integrarea E-bloc."""
-    coordinator = EBlocDataUpdateCoordinator(hass, entry.data)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    device_info = build_device_info(entry.entry_id)
 
     sensors = [
-        EBlocHomeSensor(coordinator),
-        EBlocContoareSensorApaRece(coordinator),
-        EBlocContoareSensorApaCalda(coordinator),
-        EBlocContoareSensorCaldura(coordinator),
-        EBlocContoareSensorCurent(coordinator),
-        EBlocPlatiChitanteSensor(coordinator),
+        sensor_class(coordinator, entry.entry_id, device_info)
+        for sensor_class in (
+            EBlocHomeSensor,
+            EBlocContoareSensorApaRece,
+            EBlocContoareSensorApaCalda,
+            EBlocContoareSensorCaldura,
+            EBlocContoareSensorCurent,
+            EBlocPlatiChitanteSensor,
+        )
     ]
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors)
 
-class EBlocSensorBase(SensorEntity):
+class EBlocSensorBase(CoordinatorEntity, SensorEntity):
     """Clasă de bază pentru senzorii E-bloc."""
 
-    def __init__(self, coordinator, name):
-        self._coordinator = coordinator
+    # Sufixul unique_id, precedat de ID-ul intrării
+    _unique_suffix = None
+
+    def __init__(self, coordinator, entry_id, device_info, name):
+        super().__init__(coordinator)
         self._attr_name = name
-        self._attr_state = None
-        self._attr_extra_state_attributes = {}
+        self._entry_id = entry_id
+        self._device_info = device_info
+        # Doar referințe către datele coordonatorului; starea și atributele
+        # sunt calculate la cerere, fără copii formatate păstrate în senzor.
+        self._data = {}
+        self._luna_activa = None
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Preia datele noi ale coordonatorului, inclusiv cele cerute prin serviciu."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self):
+        """Preia din coordonator datele folosite de senzor."""
+
+    @property
+    def name(self):
+        return self._attr_name
 
-    async def async_update(self):
-        """Actualizează datele pentru senzor."""
-        await self._coordinator.async_request_refresh()
+    @property
+    def unique_id(self):
+        return f"{DOMAIN}_{self._entry_id}_{self._unique_suffix}"
+
+    @property
+    def device_info(self):
+        """Returnează informațiile dispozitivului."""
+        return self._device_info
 
 class EBlocHomeSensor(EBlocSensorBase):
     """Senzor pentru `AjaxGetHomeApInfo.php`."""
 
-    def __init__(self, coordinator):
-        super().__init__(coordinator, "Date client")
+    _unique_suffix = "client"
+
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Date client")
 
-    async def async_update(self):
+    def _update_from_coordinator(self):
         """Actualizează datele pentru senzorul `home`."""
-        data = self._coordinator.data.get("home", {}).get("1", {})
-        
-        luna_activa = self._coordinator.data.get("luna_activa")
-        
-        self._attr_state = data.get("cod_client", "Necunoscut")
-        self._attr_extra_state_attributes = {
+        self._data = self.coordinator.data.get("home", {}).get("1", {})
+        self._luna_activa = self.coordinator.data.get("luna_activa")
+
+    @property
+    def state(self): return self._data.get("cod_client", "Necunoscut")
+
+    @property
+    def extra_state_attributes(self):
+        data = self._data
+        return {
             "Cod client": data.get("cod_client", "Necunoscut"),
             "Apartament": data.get("ap", "Necunoscut"),
             "Persoane declarate": data.get("nr_pers_afisat", "Necunoscut"),
@@ -165,325 +115,125 @@ class EBlocHomeSensor(EBlocSensorBase):
             "Începere citire contoare": data.get("citire_contoare_start", "Necunoscut"),
             "Încheiere citire contoare": data.get("citire_contoare_end", "Necunoscut"),
             "Luna cu datoria cea mai veche": data.get("luna_veche", "Necunoscut"),
-            "Luna afișată": luna_activa,
+            "Luna afișată": self._luna_activa,
             "Nivel restanță": data.get("nivel_restanta", "Necunoscut"),
         }
 
-    @property
-    def unique_id(self): return f"{DOMAIN}_client"
-    
-    @property
-    def name(self): return self._attr_name
-    
-    @property
-    def state(self): return self._attr_state
-    
-    @property
-    def extra_state_attributes(self): return self._attr_extra_state_attributes
-    
     @property
     def icon(self): return "mdi:account-file"
-    
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
 
-class EBlocContoareSensorApaRece(EBlocSensorBase):
-    """Senzor pentru `AjaxGetIndexContoare.php`."""
-    def __init__(self, coordinator):
-        """Actualizează datele pentru senzorul `index`."""
-        super().__init__(coordinator, "Index_contor_Apa_Rece")
-
-    async def async_update(self):
-        """Actualizează datele pentru senzorul `index`."""
-        data = self._coordinator.data.get("index", {}).get("2", {})
-
-        luna_activa = self._coordinator.data.get("luna_activa")
 
-        index_vechi = data.get("index_vechi", "").strip()
-        index_nou = data.get("index_nou", "").strip()
+def _format_index(value):
+    """Transformă indexul brut (în litri / Wh) în text cu trei zecimale."""
+    value = (value or "").strip()
+    try:
+        return f"{float(value) / 1000:.3f}" if value else "Necunoscut"
+    except ValueError:
+        return "Necunoscut"
 
-        try:
-            index_vechi = f"{float(index_vechi) / 1000:.3f}" if index_vechi else "Necunoscut"
-        except ValueError:
-            index_vechi = "Necunoscut"
 
-        try:
-            index_nou = f"{float(index_nou) / 1000:.3f}" if index_nou else "Necunoscut"
-        except ValueError:
-            index_nou = "Necunoscut"
+class EBlocContoareSensor(EBlocSensorBase):
+    """Clasă de bază pentru senzorii `AjaxGetIndexContoare.php`."""
 
-        consum = (float(index_nou) - float(index_vechi)) if index_nou != "Necunoscut" and index_vechi != "Necunoscut" else "Necunoscut"
-        # Setăm starea senzorului pentru `index_nou`
-        self._attr_state = f"{index_nou}" if index_nou != "Necunoscut" else "Necunoscut"
-        # Atribute suplimentare
-        self._attr_extra_state_attributes = {
-            "Index vechi": f"{index_vechi}" if index_vechi != "Necunoscut" else "Necunoscut",
-            "Index nou": f"{index_nou}" if index_nou != "Necunoscut" else "",
-            "Consum": f"{consum:.3f}" if consum != "Necunoscut" else "Necunoscut",
-            "Luna afisata": luna_activa if luna_activa != "Necunoscut" else "Necunoscut",
-            "Unitate masurare": "mc",
-        }
-    @property
-    def unique_id(self):
-        return f"{DOMAIN}_contor_apa_rece"
+    # Setate de fiecare contor: cheia din răspuns, sufixul unique_id și unitatea
+    _index_key = None
+    _unit = None
 
-    @property
-    def name(self):
-        return self._attr_name
+    def _update_from_coordinator(self):
+        """Actualizează datele pentru senzorul `index`."""
+        self._data = self.coordinator.data.get("index", {}).get(self._index_key, {})
+        self._luna_activa = self.coordinator.data.get("luna_activa")
 
     @property
     def state(self):
-        return self._attr_state
+        # Starea senzorului este `index_nou`
+        return _format_index(self._data.get("index_nou"))
 
     @property
     def extra_state_attributes(self):
-        return self._attr_extra_state_attributes
-
-    @property
-    def icon(self):
-        """Pictograma senzorului."""
-        return "mdi:counter"
-
-    @property
-    def device_info(self):
-        """Returnează informațiile dispozitivului."""
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
-
-class EBlocContoareSensorApaCalda(EBlocSensorBase):
-    """Senzor pentru `AjaxGetIndexContoare.php`."""
-    def __init__(self, coordinator):
-        """Actualizează datele pentru senzorul `index`."""
-        super().__init__(coordinator, "Index_contor_Apa_Calda")
-    async def async_update(self):
-        """Actualizează datele pentru senzorul `index`."""
-        data = self._coordinator.data.get("index", {}).get("3", {})
-
-        luna_activa = self._coordinator.data.get("luna_activa")
-
-        index_vechi = data.get("index_vechi", "").strip()
-        index_nou = data.get("index_nou", "").strip()
-
-        try:
-            index_vechi = f"{float(index_vechi) / 1000:.3f}" if index_vechi else "Necunoscut"
-        except ValueError:
-            index_vechi = "Necunoscut"
-
-        try:
-            index_nou = f"{float(index_nou) / 1000:.3f}" if index_nou else "Necunoscut"
-        except ValueError:
-            index_nou = "Necunoscut"
-
+        index_vechi = _format_index(self._data.get("index_vechi"))
+        index_nou = _format_index(self._data.get("index_nou"))
         consum = (float(index_nou) - float(index_vechi)) if index_nou != "Necunoscut" and index_vechi != "Necunoscut" else "Necunoscut"
-        # Setăm starea senzorului pentru `index_nou`
-        self._attr_state = f"{index_nou}" if index_nou != "Necunoscut" else "Necunoscut"
-        # Atribute suplimentare
-        self._attr_extra_state_attributes = {
+        luna_activa = self._luna_activa
+        return {
             "Index vechi": f"{index_vechi}" if index_vechi != "Necunoscut" else "Necunoscut",
             "Index nou": f"{index_nou}" if index_nou != "Necunoscut" else "",
             "Consum": f"{consum:.3f}" if consum != "Necunoscut" else "Necunoscut",
             "Luna afisata": luna_activa if luna_activa != "Necunoscut" else "Necunoscut",
-            "Unitate masurare": "mc",
+            "Unitate masurare": self._unit,
         }
-    @property
-    def unique_id(self):
-        return f"{DOMAIN}_contor_apa_calda"
 
     @property
-    def name(self):
-        return self._attr_name
-
-    @property
-    def state(self):
-        return self._attr_state
-
-    @property
-    def extra_state_attributes(self):
-        return self._attr_extra_state_attributes
-    @property
     def icon(self):
         """Pictograma senzorului."""
         return "mdi:counter"
 
-    @property
-    def device_info(self):
-        """Returnează informațiile dispozitivului."""
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
-        
-class EBlocContoareSensorCaldura(EBlocSensorBase):
+
+class EBlocContoareSensorApaRece(EBlocContoareSensor):
     """Senzor pentru `AjaxGetIndexContoare.php`."""
 
-    def __init__(self, coordinator):
-        """Actualizează datele pentru senzorul `index`."""
-        super().__init__(coordinator, "Index_contor_Caldura")
+    _index_key = "2"
+    _unique_suffix = "contor_apa_rece"
+    _unit = "mc"
 
-    async def async_update(self):
-        """Actualizează datele pentru senzorul `index`."""
-        data = self._coordinator.data.get("index", {}).get("4", {})
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Index_contor_Apa_Rece")
 
-        luna_activa = self._coordinator.data.get("luna_activa")
-        index_vechi = data.get("index_vechi", "").strip()
-        index_nou = data.get("index_nou", "").strip()
 
-        try:
-            index_vechi = f"{float(index_vechi) / 1000:.3f}" if index_vechi else "Necunoscut"
-        except ValueError:
-            index_vechi = "Necunoscut"
+class EBlocContoareSensorApaCalda(EBlocContoareSensor):
+    """Senzor pentru `AjaxGetIndexContoare.php`."""
 
-        try:
-            index_nou = f"{float(index_nou) / 1000:.3f}" if index_nou else "Necunoscut"
-        except ValueError:
-            index_nou = "Necunoscut"
+    _index_key = "3"
+    _unique_suffix = "contor_apa_calda"
+    _unit = "mc"
 
-        consum = (float(index_nou) - float(index_vechi)) if index_nou != "Necunoscut" and index_vechi != "Necunoscut" else "Necunoscut"
-        # Setăm starea senzorului pentru `index_nou`
-        self._attr_state = f"{index_nou}" if index_nou != "Necunoscut" else "Necunoscut"
-        # Atribute suplimentare
-        self._attr_extra_state_attributes = {
-            "Index vechi": f"{index_vechi}" if index_vechi != "Necunoscut" else "Necunoscut",
-            "Index nou": f"{index_nou}" if index_nou != "Necunoscut" else "",
-            "Consum": f"{consum:.3f}" if consum != "Necunoscut" else "Necunoscut",
-            "Luna afisata": luna_activa if luna_activa != "Necunoscut" else "Necunoscut",
-            "Unitate masurare": "kWh",
-        }
-    @property
-    def unique_id(self):
-        return f"{DOMAIN}_contor_caldura"
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Index_contor_Apa_Calda")
 
-    @property
-    def name(self):
-        return self._attr_name
 
-    @property
-    def state(self):
-        return self._attr_state
+class EBlocContoareSensorCaldura(EBlocContoareSensor):
+    """Senzor pentru `AjaxGetIndexContoare.php`."""
 
-    @property
-    def extra_state_attributes(self):
-        return self._attr_extra_state_attributes
+    _index_key = "4"
+    _unique_suffix = "contor_caldura"
+    _unit = "kWh"
 
-    @property
-    def icon(self):
-        """Pictograma senzorului."""
-        return "mdi:counter"
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Index_contor_Caldura")
 
-    @property
-    def device_info(self):
-        """Returnează informațiile dispozitivului."""
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
 
-class EBlocContoareSensorCurent(EBlocSensorBase):
+class EBlocContoareSensorCurent(EBlocContoareSensor):
     """Senzor pentru `AjaxGetIndexContoare.php`."""
 
-    def __init__(self, coordinator):
-        """Actualizează datele pentru senzorul `index`."""
-        super().__init__(coordinator, "Index_contor_Curent")
-
-    async def async_update(self):
-        """Actualizează datele pentru senzorul `index`."""
-        data = self._coordinator.data.get("index", {}).get("5", {})
+    _index_key = "5"
+    _unique_suffix = "contor_curent"
+    _unit = "kWh"
 
-        luna_activa = self._coordinator.data.get("luna_activa")
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Index_contor_Curent")
 
 
-        index_vechi = data.get("index_vechi", "").strip()
-        index_nou = data.get("index_nou", "").strip()
-
-        try:
-            index_vechi = f"{float(index_vechi) / 1000:.3f}" if index_vechi else "Necunoscut"
-        except ValueError:
-            index_vechi = "Necunoscut"
-
-        try:
-            index_nou = f"{float(index_nou) / 1000:.3f}" if index_nou else "Necunoscut"
-        except ValueError:
-            index_nou = "Necunoscut"
+class EBlocPlatiChitanteSensor(EBlocSensorBase):
+    """Senzor pentru `AjaxGetPlatiChitanteToti.php`."""
 
-        consum = (float(index_nou) - float(index_vechi)) if index_nou != "Necunoscut" and index_vechi != "Necunoscut" else "Necunoscut"
-        # Setăm starea senzorului pentru `index_nou`
-        self._attr_state = f"{index_nou}" if index_nou != "Necunoscut" else "Necunoscut"
-        # Atribute suplimentare
+    _unique_suffix = "plati_si_chitante"
 
-        self._attr_extra_state_attributes = {
-            "Index vechi": f"{index_vechi}" if index_vechi != "Necunoscut" else "Necunoscut",
-            "Index nou": f"{index_nou}" if index_nou != "Necunoscut" else "",
-            "Consum": f"{consum:.3f}" if consum != "Necunoscut" else "Necunoscut",
-            "Luna afisata": luna_activa if luna_activa != "Necunoscut" else "Necunoscut",
-            "Unitate masurare": "kWh",
-        }
-    @property
-    def unique_id(self):
-        return f"{DOMAIN}_contor_curent"
+    def __init__(self, coordinator, entry_id, device_info):
+        super().__init__(coordinator, entry_id, device_info, "Plăți și chitanțe")
 
-    @property
-    def name(self):
-        return self._attr_name
+    def _update_from_coordinator(self):
+        """Actualizează datele pentru senzorul `plati_chitante`."""
+        self._data = self.coordinator.data.get("receipts", {})
 
     @property
     def state(self):
-        return self._attr_state
+        # Starea senzorului este numărul de chitanțe
+        return len(self._data)
 
     @property
     def extra_state_attributes(self):
-        return self._attr_extra_state_attributes
-
-    @property
-    def icon(self):
-        """Pictograma senzorului."""
-        return "mdi:counter"
-
-    @property
-    def device_info(self):
-        """Returnează informațiile dispozitivului."""
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
-        
-class EBlocPlatiChitanteSensor(EBlocSensorBase):
-    """Senzor pentru `AjaxGetPlatiChitanteToti.php`."""
-
-    def __init__(self, coordinator):
-        super().__init__(coordinator, "Plăți și chitanțe")
-
-    async def async_update(self):
-        """Actualizează datele pentru senzorul `plati_chitante`."""
-        data = self._coordinator.data.get("receipts", {})
-        numar_chitante = len(data)
-
-        # Setăm starea senzorului pe baza numărului de chitanțe
-        self._attr_state = numar_chitante
-
-        # Creăm atribute suplimentare
-        atribute = {"Număr total de chitanțe": numar_chitante}
-        for idx, chitanta_data in data.items():
+        atribute = {"Număr total de chitanțe": len(self._data)}
+        for idx, chitanta_data in self._data.items():
             numar = chitanta_data.get("numar", "Necunoscut")
             data_chitanta = chitanta_data.get("data", "Necunoscut")
             suma = chitanta_data.get("suma", "0")
@@ -493,38 +243,9 @@ class EBlocPlatiChitanteSensor(EBlocSensorBase):
             atribute[f"Chitanță {idx}"] = numar
             atribute[f"Data {idx}"] = data_chitanta
             atribute[f"Sumă plătită {idx}"] = suma_formatata
-
-        # Atribuim atributele suplimentare
-        self._attr_extra_state_attributes = atribute
-
-    @property
-    def unique_id(self):
-        return f"{DOMAIN}_plati_si_chitante"
-
-    @property
-    def name(self):
-        return self._attr_name
-
-    @property
-    def state(self):
-        return self._attr_state
-
-    @property
-    def extra_state_attributes(self):
-        return self._attr_extra_state_attributes
+        return atribute
 
     @property
     def icon(self):
         """Pictograma senzorului."""
         return "mdi:credit-card-check-outline"
-
-    @property
-    def device_info(self):
-        """Returnează informațiile dispozitivului."""
-        return {
-            "identifiers": {(DOMAIN, "home")},
-            "name": "Interfață UI pentru E-bloc.ro",
-            "manufacturer": "E-bloc.ro",
-            "model": "Interfață UI pentru E-bloc.ro",
-            "entry_type": DeviceEntryType.SERVICE,
-        }
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""Fixture-uri comune: răspunsuri e-bloc.ro redate prin `ReplaySession`."""
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Pachetul `ebloc` (independent de Home Assistant) se importă din directorul integrării
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components" / "e-bloc"))
+
+# Importăm `custom_components` din depozit înainte ca fixture-ul `hass` să monteze
+# directorul de configurare de test (care are propriul pachet `custom_components`)
+import custom_components  # noqa: E402, F401
+
+from ebloc.const import URL_LOGIN, URL_LISTA_LUNI, URL_HOME, URL_INDEX, URL_RECEIPTS  # noqa: E402
+from ebloc.replay import BUNDLE_VERSION, ReplaySession  # noqa: E402
+
+ACCOUNT = {"pUser": "ion.popescu@example.com", "pPass": "parola-secreta", "pIdAsoc": "1234", "pIdAp": "22"}
+
+LISTA_LUNI = {
+    "1": {"luna": "2024-12", "open": "1"},
+    "2": {"luna": "2024-11", "open": "0"},
+    "3": {"luna": "2024-10", "open": "0"},
+}
+
+HOME = {
+    "1": {
+        "cod_client": "A12345F",
+        "ap": "22",
+        "nr_pers_afisat": "2",
+        "datorie": "22175",
+        "ultima_zi_plata": "2025-01-12",
+        "contoare_citite": "0",
+        "citire_contoare_start": "2024-12-20",
+        "citire_contoare_end": "2024-12-25",
+        "luna_veche": "2024-11",
+        "nivel_restanta": "0",
+        "adresa": "Str. Exemplu 1",
+    }
+}
+
+INDEX = {
+    "2": {"index_vechi": "79344", "index_nou": "80258", "titlu": "Apa rece"},
+    "3": {"index_vechi": "12000", "index_nou": "12500", "titlu": "Apa calda"},
+    "4": {"index_vechi": "", "index_nou": "", "titlu": "Caldura"},
+    "5": {"index_vechi": "1000", "index_nou": "abc", "titlu": "Curent"},
+}
+
+RECEIPTS = {
+    "1": {"numar": "4300000001", "data": "2024-11-27", "suma": "26251", "tip_plata": "card"},
+    "2": {"numar": "4300000002", "data": "2024-10-30", "suma": "21360", "tip_plata": "card"},
+}
+
+DEFAULT_RESPONSES = {
+    URL_LOGIN: "<html>Acces online proprietari</html>",
+    URL_LISTA_LUNI: LISTA_LUNI,
+    URL_HOME: HOME,
+    URL_INDEX: INDEX,
+    URL_RECEIPTS: RECEIPTS,
+}
+
+
+def _exchange(url, response):
+    status, body = response if isinstance(response, tuple) else (200, response)
+    return {
+        "method": "POST",
+        "url": url,
+        "payload": {},
+        "status": status,
+        "body": body if isinstance(body, str) else json.dumps(body),
+        "duration": 0,
+    }
+
+
+def make_bundle(overrides=None):
+    """Înregistrare cu răspunsurile implicite; `overrides` mapează URL -> răspuns sau listă de răspunsuri.
+
+    Un răspuns este fie corpul (dicționar sau text, status 200), fie `(status, corp)`.
+    """
+    responses = {**DEFAULT_RESPONSES, **(overrides or {})}
+    exchanges = []
+    for url, response in responses.items():
+        for item in response if isinstance(response, list) else [response]:
+            exchanges.append(_exchange(url, item))
+    return {"version": BUNDLE_VERSION, "exchanges": exchanges}
+
+
+class FakeSession(ReplaySession):
+    """`ReplaySession` fără așteptare, care reține dacă a fost închisă."""
+
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+    def requests(self, url):
+        """Numărul de cereri făcute către `url`."""
+        return self._positions[url]
+
+
+def make_session(overrides=None, loop=False):
+    """Sesiune care redă răspunsurile, fără așteptare."""
+    return FakeSession(make_bundle(overrides), speed=0, loop=loop)
+
+
+class FakeSite:
+    """Răspunsurile site-ului pentru sesiunile create de integrare."""
+
+    def __init__(self):
+        self.overrides = {}
+        self.sessions = []
+
+    def session(self):
+        session = make_session(self.overrides)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def account():
+    return dict(ACCOUNT)
+
+
+@pytest.fixture
+def integration_module():
+    """Modulele integrării, așa cum le importă Home Assistant."""
+    return lambda name="": importlib.import_module(
+        "custom_components.e-bloc" + (f".{name}" if name else "")
+    )
+
+
+@pytest.fixture
+def site(integration_module, monkeypatch):
+    """Sesiunile HTTP create de integrare redau răspunsurile din `site.overrides`."""
+    site = FakeSite()
+    monkeypatch.setattr(integration_module("ebloc.client"), "ClientSession", site.session)
+    return site
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(request):
+    """Activează integrările din `custom_components` pentru testele Home Assistant."""
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("enable_custom_integrations")
@@ -0,0 +1,46 @@
+"""Teste pentru `ebloc.client`."""
+import pytest
+
+from ebloc.client import EBlocAuthError, EBlocClient, EBlocError, get_luna_activa
+from ebloc.const import URL_INDEX, URL_LOGIN
+
+from .conftest import INDEX, LISTA_LUNI, make_session
+
+
+def test_get_luna_activa_prima_luna_inchisa():
+    assert get_luna_activa(LISTA_LUNI) == "2024-11"
+
+
+def test_get_luna_activa_toate_deschise():
+    lista_luni = {k: {**v, "open": "1"} for k, v in LISTA_LUNI.items()}
+    assert get_luna_activa(lista_luni) == "2024-12"
+
+
+async def test_fetch_tolerant_returneaza_dict_gol(account):
+    client = EBlocClient.from_config(account, session=make_session({URL_INDEX: (500, "")}))
+    assert await client.get_index("2024-11") == {}
+
+
+async def test_fetch_strict_ridica_eroare_la_status(account):
+    client = EBlocClient.from_config(account, session=make_session({URL_INDEX: (500, "")}), strict=True)
+    with pytest.raises(EBlocError):
+        await client.get_index("2024-11")
+
+
+async def test_fetch_strict_ridica_eroare_la_json_invalid(account):
+    client = EBlocClient.from_config(account, session=make_session({URL_INDEX: "<html>"}), strict=True)
+    with pytest.raises(EBlocError):
+        await client.get_index("2024-11")
+
+
+async def test_fetch_strict_per_cerere(account):
+    client = EBlocClient.from_config(account, session=make_session({URL_INDEX: [(500, ""), INDEX]}))
+    with pytest.raises(EBlocError):
+        await client.fetch(URL_INDEX, "2024-11", strict=True)
+    assert await client.fetch(URL_INDEX, "2024-11", strict=True) == INDEX
+
+
+async def test_autentificare_esuata(account):
+    client = EBlocClient.from_config(account, session=make_session({URL_LOGIN: "Parolă greșită"}))
+    with pytest.raises(EBlocAuthError):
+        await client.get_lista_luni()
@@ -0,0 +1,131 @@
+"""Teste pentru reîmprospătarea parțială din `EBlocDataUpdateCoordinator`."""
+from datetime import timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from ebloc.const import URL_HOME, URL_INDEX, URL_LISTA_LUNI, URL_RECEIPTS
+
+from .conftest import ACCOUNT, HOME, INDEX, LISTA_LUNI, RECEIPTS, make_session
+
+
+@pytest.fixture
+async def make_coordinator(hass, integration_module):
+    coordinator_module = integration_module("coordinator")
+    coordinators = []
+
+    async def factory(overrides=None):
+        session = make_session(overrides)
+        coordinator = coordinator_module.EBlocDataUpdateCoordinator(hass, ACCOUNT, session=session)
+        coordinators.append(coordinator)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        return coordinator, session
+
+    yield factory
+
+    for coordinator in coordinators:
+        coordinator.async_cancel_pending_refresh()
+        await coordinator.async_shutdown()
+
+
+async def test_refresh_partial_pastreaza_restul_datelor(make_coordinator):
+    home_nou = {"1": {**HOME["1"], "cod_client": "B99999X"}}
+    coordinator, session = await make_coordinator({URL_HOME: [HOME, home_nou]})
+    index_vechi = coordinator.data["index"]
+
+    await coordinator.async_request_endpoints_refresh(["home"])
+    await coordinator._async_refresh_pending_endpoints()
+
+    assert coordinator.data["home"] == home_nou
+    assert coordinator.data["index"] is index_vechi
+    assert coordinator.data["luna_activa"] == "2024-11"
+    assert session.requests(URL_LISTA_LUNI) == 1
+    assert session.requests(URL_INDEX) == 1
+    assert session.requests(URL_RECEIPTS) == 1
+
+
+async def test_luna_noua_forteaza_refresh_complet(make_coordinator):
+    luni_noi = {k: {**v, "open": "1"} for k, v in LISTA_LUNI.items()}
+    coordinator, session = await make_coordinator({
+        URL_LISTA_LUNI: [LISTA_LUNI, luni_noi],
+        URL_HOME: [HOME, HOME],
+        URL_INDEX: [INDEX, INDEX],
+        URL_RECEIPTS: [RECEIPTS, RECEIPTS],
+    })
+
+    await coordinator.async_request_endpoints_refresh(["lista_luni"])
+    await coordinator._async_refresh_pending_endpoints()
+
+    assert coordinator.data["luna_activa"] == "2024-12"
+    assert session.requests(URL_HOME) == 2
+    assert session.requests(URL_INDEX) == 2
+    assert session.requests(URL_RECEIPTS) == 2
+
+
+async def test_luna_noua_cu_endpoint_esuat_pastreaza_luna_veche(make_coordinator):
+    luni_noi = {k: {**v, "open": "1"} for k, v in LISTA_LUNI.items()}
+    coordinator, session = await make_coordinator({
+        URL_LISTA_LUNI: [LISTA_LUNI, luni_noi],
+        URL_HOME: [HOME, (500, "")],
+        URL_INDEX: [INDEX, INDEX],
+        URL_RECEIPTS: [RECEIPTS, RECEIPTS],
+    })
+    data = coordinator.data
+
+    await coordinator.async_request_endpoints_refresh(["lista_luni"])
+    await coordinator._async_refresh_pending_endpoints()
+
+    # Datele lunii vechi nu sunt etichetate cu luna nouă
+    assert coordinator.data is data
+    assert coordinator.data["luna_activa"] == "2024-11"
+    assert session.requests(URL_HOME) == 2
+
+
+async def test_endpoint_esuat_nu_suprascrie_datele(make_coordinator):
+    coordinator, session = await make_coordinator({
+        URL_INDEX: [INDEX, (500, "")],
+        URL_HOME: [HOME, HOME],
+    })
+
+    await coordinator.async_request_endpoints_refresh(["index", "home"])
+    await coordinator._async_refresh_pending_endpoints()
+
+    assert coordinator.data["index"] == INDEX
+    assert session.requests(URL_INDEX) == 2
+    assert session.requests(URL_HOME) == 2
+
+
+async def test_apeluri_repetate_sunt_grupate(hass, make_coordinator):
+    coordinator, session = await make_coordinator({
+        URL_HOME: [HOME, HOME],
+        URL_INDEX: [INDEX, INDEX],
+    })
+    updates = []
+    coordinator.async_add_listener(lambda: updates.append(coordinator.data))
+
+    for endpoints in (["home"], ["index"], ["home"]):
+        await coordinator.async_request_endpoints_refresh(endpoints)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert len(updates) == 1
+    assert session.requests(URL_HOME) == 2
+    assert session.requests(URL_INDEX) == 2
+    assert session.requests(URL_RECEIPTS) == 1
+
+
+async def test_toate_endpointurile_fac_refresh_complet(make_coordinator):
+    coordinator, session = await make_coordinator({
+        URL_LISTA_LUNI: [LISTA_LUNI, LISTA_LUNI],
+        URL_HOME: [HOME, HOME],
+        URL_INDEX: [INDEX, INDEX],
+        URL_RECEIPTS: [RECEIPTS, RECEIPTS],
+    })
+
+    await coordinator.async_request_endpoints_refresh()
+    await coordinator._async_refresh_pending_endpoints()
+
+    assert coordinator.last_update_success
+    assert session.requests(URL_LISTA_LUNI) == 2
@@ -0,0 +1,73 @@
+"""Teste pentru `ebloc.export`."""
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+from ebloc import client as client_module
+from ebloc import export
+from ebloc.const import URL_INDEX, URL_RECEIPTS
+
+from .conftest import INDEX, RECEIPTS, make_session
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Fiecare client creat de export primește o sesiune redată cu răspunsurile date."""
+    overrides = {}
+    monkeypatch.setattr(client_module, "ClientSession", lambda: make_session(overrides, loop=True))
+    return overrides
+
+
+async def test_export_jsonl(sessions, account):
+    output = io.StringIO()
+    failures = await export.export_accounts([account], output, "jsonl", months=1)
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failures == []
+    assert [row["tip"] for row in rows] == ["index"] * len(INDEX) + ["chitanta"] * len(RECEIPTS)
+    assert rows[0]["luna"] == "2024-12"
+    assert rows[0]["apartament"] == account["pIdAp"]
+
+
+async def test_export_csv_mai_multe_conturi(sessions, account):
+    accounts = [{**account, "pIdAp": str(ap)} for ap in range(5)]
+    output = io.StringIO()
+    failures = await export.export_accounts(accounts, output, "csv", concurrency=2, months=2)
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert failures == []
+    assert len(rows) == len(accounts) * (2 * len(INDEX) + len(RECEIPTS))
+    assert {row["apartament"] for row in rows} == {str(ap) for ap in range(5)}
+
+
+async def test_export_cont_esuat_raportat_fara_randuri_partiale(sessions, account):
+    sessions[URL_RECEIPTS] = (500, "")
+    output = io.StringIO()
+    failures = await export.export_accounts([account], output, "jsonl")
+
+    assert failures == [account]
+    assert output.getvalue() == ""
+
+
+async def test_export_json_invalid_raportat(sessions, account):
+    sessions[URL_INDEX] = "<html>Eroare</html>"
+    failures = await export.export_accounts([account], io.StringIO(), "jsonl")
+    assert failures == [account]
+
+
+class _BrokenOutput(io.StringIO):
+    def write(self, text):
+        raise BrokenPipeError("pipe închis")
+
+
+async def test_export_eroare_la_scriere_nu_blocheaza(sessions, account, monkeypatch):
+    monkeypatch.setattr(export, "QUEUE_SIZE", 2)
+    accounts = [{**account, "pIdAp": str(ap)} for ap in range(10)]
+
+    with pytest.raises(BrokenPipeError):
+        await asyncio.wait_for(
+            export.export_accounts(accounts, _BrokenOutput(), "jsonl", concurrency=3), timeout=5
+        )
@@ -0,0 +1,152 @@
+"""Teste pentru configurarea integrării și serviciul `e-bloc.refresh`."""
+import json
+from datetime import timedelta
+from pathlib import Path
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from ebloc.const import URL_HOME, URL_INDEX, URL_LOGIN
+
+from .conftest import ACCOUNT, HOME
+
+DOMAIN = "e-bloc"
+
+
+async def _setup_entry(hass, data=None, version=2):
+    entry = MockConfigEntry(domain=DOMAIN, data=data or ACCOUNT, version=version)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_setup_si_unload(hass, site):
+    entry = await _setup_entry(hass)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.services.has_service(DOMAIN, "refresh")
+    assert hass.states.get("sensor.date_client").state == "A12345F"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert site.sessions[0].closed
+
+
+async def test_setup_esuat_inchide_sesiunea(hass, site):
+    site.overrides[URL_LOGIN] = "Parolă greșită"
+    entry = await _setup_entry(hass)
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert site.sessions[0].closed
+
+
+async def test_serviciu_refresh_doar_endpointurile_cerute(hass, site):
+    home_nou = {"1": {**HOME["1"], "cod_client": "B99999X"}}
+    site.overrides[URL_HOME] = [HOME, home_nou]
+    await _setup_entry(hass)
+    session = site.sessions[0]
+
+    await hass.services.async_call(DOMAIN, "refresh", {"endpoints": ["home"]}, blocking=True)
+    await hass.services.async_call(DOMAIN, "refresh", {"endpoints": "home"}, blocking=True)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.date_client").state == "B99999X"
+    assert session.requests(URL_HOME) == 2
+    assert session.requests(URL_INDEX) == 1
+
+
+async def test_serviciu_refresh_apartament_necunoscut(hass, site):
+    await _setup_entry(hass)
+    session = site.sessions[0]
+
+    await hass.services.async_call(DOMAIN, "refresh", {"apartment": "999"}, blocking=True)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert session.requests(URL_HOME) == 1
+
+
+async def test_inregistrare_din_home_assistant(hass, site):
+    entry = await _setup_entry(hass)
+
+    await hass.services.async_call(DOMAIN, "start_recording", {"entry_id": entry.entry_id}, blocking=True)
+    await hass.services.async_call(DOMAIN, "refresh", {"endpoints": ["index"]}, blocking=True)
+    site.sessions[0].loop = True
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    await hass.services.async_call(DOMAIN, "stop_recording", {}, blocking=True)
+
+    recordings = list(Path(hass.config.path("e-bloc", "recordings")).glob(f"{entry.entry_id}_*.json"))
+    assert len(recordings) == 1
+    bundle = json.loads(recordings[0].read_text(encoding="utf-8"))
+    assert [exchange["url"] for exchange in bundle["exchanges"]] == [URL_INDEX]
+    assert ACCOUNT["pPass"] not in recordings[0].read_text(encoding="utf-8")
+
+
+async def test_inregistrarea_este_salvata_la_unload(hass, site):
+    entry = await _setup_entry(hass)
+
+    await hass.services.async_call(DOMAIN, "start_recording", {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    recordings = list(Path(hass.config.path("e-bloc", "recordings")).glob(f"{entry.entry_id}_*.json"))
+    assert len(recordings) == 1
+    assert site.sessions[0].closed
+
+
+async def test_dispozitiv_si_unique_id_per_intrare(hass, site):
+    first = await _setup_entry(hass)
+    second = await _setup_entry(hass, {**ACCOUNT, "pIdAp": "23"})
+
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for entry in (first, second):
+        entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+        assert len(entities) == 6
+        assert all(entity.unique_id.startswith(f"{DOMAIN}_{entry.entry_id}_") for entity in entities)
+        assert {entity.device_id for entity in entities} == {
+            device_registry.async_get_device(identifiers={(DOMAIN, entry.entry_id)}).id
+        }
+    assert hass.states.get("sensor.date_client_2").state == "A12345F"
+
+
+async def test_migrare_unique_id_si_dispozitiv(hass, site):
+    entry = MockConfigEntry(domain=DOMAIN, data={**ACCOUNT, "memory_lean": True}, version=1)
+    entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(config_entry_id=entry.entry_id, identifiers={(DOMAIN, "home")})
+    entity_registry = er.async_get(hass)
+    old = entity_registry.async_get_or_create(
+        "sensor", DOMAIN, f"{DOMAIN}_client", config_entry=entry, suggested_object_id="date_client"
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.version == 2
+    assert entity_registry.async_get(old.entity_id).unique_id == f"{DOMAIN}_{entry.entry_id}_client"
+    assert device_registry.async_get(device.id).identifiers == {(DOMAIN, entry.entry_id)}
+    assert "memory_lean" not in entry.data
+    assert entry.options == {"memory_lean": True}
+    assert hass.data[DOMAIN][entry.entry_id].memory_lean
+    assert hass.states.get(old.entity_id).state == "A12345F"
+
+
+async def test_optiuni_o_singura_reincarcare(hass, site):
+    entry = await _setup_entry(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], {**ACCOUNT, "memory_lean": True}
+    )
+    await hass.async_block_till_done()
+
+    assert entry.data == ACCOUNT
+    assert entry.options == {"memory_lean": True}
+    assert hass.data[DOMAIN][entry.entry_id].memory_lean
+    # O sesiune la configurare și una singură la reîncărcare
+    assert len(site.sessions) == 2
@@ -0,0 +1,101 @@
+"""Teste pentru `ebloc.replay`."""
+import json
+import logging
+
+from ebloc.client import EBlocClient
+from ebloc.const import URL_INDEX, URL_LOGIN
+from ebloc.replay import MASK, RecordingSession, ReplaySession, mask_secrets
+
+from .conftest import ACCOUNT, INDEX, make_bundle, make_session
+
+
+def test_mask_secrets_json_doar_valori_exacte(caplog):
+    body = json.dumps({"1": {"index_nou": "1234", "suma": "12345", "email": "ion@example.com"}})
+
+    with caplog.at_level(logging.WARNING):
+        masked = json.loads(mask_secrets(body, {"1234", "ion@example.com"}, URL_INDEX))
+
+    assert masked == {"1": {"index_nou": MASK, "suma": "12345", "email": MASK}}
+    assert "mascate" in caplog.text
+
+
+def test_mask_secrets_json_neschimbat_pastreaza_corpul(caplog):
+    body = json.dumps({"2": {"index_vechi": "79344", "index_nou": "80258"}})
+
+    with caplog.at_level(logging.WARNING):
+        assert mask_secrets(body, {"1234"}, URL_INDEX) == body
+    assert caplog.text == ""
+
+
+def test_mask_secrets_json_subsir_in_valori(caplog):
+    body = json.dumps({"contact": "Ion <ion.popescu@example.com>", "suma": "12345"})
+
+    with caplog.at_level(logging.WARNING):
+        masked = json.loads(mask_secrets(body, {"ion.popescu@example.com", "1234"}, URL_INDEX))
+
+    assert masked == {"contact": f"Ion <{MASK}>", "suma": "12345"}
+    assert "mascate" in caplog.text
+
+
+def test_mask_secrets_text_secret_scurt_doar_ca_token():
+    body = "<html>parola ta: 8025, index 80258</html>"
+    assert mask_secrets(body, {"8025"}, URL_LOGIN) == f"<html>parola ta: {MASK}, index 80258</html>"
+
+
+def test_mask_secrets_text_secret_lung():
+    body = "<html>Bine ai venit, ion.popescu@example.com</html>"
+    assert mask_secrets(body, {"ion.popescu@example.com"}) == f"<html>Bine ai venit, {MASK}</html>"
+
+
+async def test_inregistrare_si_redare(account, tmp_path):
+    short_password = {**account, "pPass": "8025"}  # subșir al unui index, nu trebuie să-l altereze
+    recorder = RecordingSession(make_session())
+    data = await EBlocClient.from_config(short_password, session=recorder).fetch_endpoints()
+
+    path = tmp_path / "inregistrari" / "bundle.json"
+    recorder.save(str(path))
+    bundle = json.loads(path.read_text(encoding="utf-8"))
+
+    assert bundle["exchanges"][0]["payload"] == {"pUser": MASK, "pPass": MASK}
+    assert ACCOUNT["pUser"] not in path.read_text(encoding="utf-8")
+
+    replayed = await EBlocClient.from_config(account, session=ReplaySession.load(str(path), speed=0)).fetch_endpoints()
+    assert replayed == data
+    assert replayed["index"] == INDEX
+
+
+async def test_secretele_lipsesc_din_fisierul_salvat(account, tmp_path):
+    short_password = {**account, "pPass": "8025"}
+    recorder = RecordingSession(make_session({
+        URL_LOGIN: "<html>Acces online proprietari, parola ta: 8025</html>",
+        URL_INDEX: {"contact": f"Ion <{ACCOUNT['pUser']}>", **INDEX},
+    }))
+    await EBlocClient.from_config(short_password, session=recorder).fetch_endpoints()
+
+    path = tmp_path / "bundle.json"
+    recorder.save(str(path))
+    saved = path.read_text(encoding="utf-8")
+
+    assert ACCOUNT["pUser"] not in saved
+    assert "parola ta: 8025" not in saved
+    assert "80258" in saved
+
+
+async def test_redarea_respecta_pauzele_dintre_cereri(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("ebloc.replay.asyncio.sleep", fake_sleep)
+    bundle = make_bundle()
+    for exchange, (offset, duration) in zip(bundle["exchanges"], [(1.0, 0.5), (2.0, 0.25), (2.5, 0.5)]):
+        exchange.update(offset=offset, duration=duration)
+    session = ReplaySession(bundle, speed=2)
+
+    for exchange in bundle["exchanges"][:3]:
+        async with session.post(exchange["url"]):
+            pass
+
+    # Prima cerere: doar durata; apoi pauza de la sfârșitul cererii anterioare + durata
+    assert delays == [1.0, 1.5, 1.5]
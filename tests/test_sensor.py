@@ -0,0 +1,80 @@
+"""Teste pentru senzorii E-bloc."""
+import copy
+
+import pytest
+
+from .conftest import ACCOUNT, HOME, INDEX, RECEIPTS
+
+RAW_DATA = {
+    "home": HOME,
+    "index": INDEX,
+    "receipts": RECEIPTS,
+    "lista_luni": {},
+    "luna_activa": "2024-11",
+}
+
+SENSOR_CLASSES = (
+    "EBlocHomeSensor",
+    "EBlocContoareSensorApaRece",
+    "EBlocContoareSensorApaCalda",
+    "EBlocContoareSensorCaldura",
+    "EBlocContoareSensorCurent",
+    "EBlocPlatiChitanteSensor",
+)
+
+
+@pytest.fixture
+def sensors_for(hass, integration_module):
+    sensor_module = integration_module("sensor")
+    coordinator_module = integration_module("coordinator")
+
+    def factory(data):
+        coordinator = coordinator_module.EBlocDataUpdateCoordinator(hass, ACCOUNT)
+        coordinator.data = data
+        device_info = sensor_module.build_device_info("entry")
+        return [getattr(sensor_module, name)(coordinator, "entry", device_info) for name in SENSOR_CLASSES]
+
+    return factory
+
+
+async def test_descriptor_comun_si_imuabil(sensors_for):
+    sensors = sensors_for(RAW_DATA)
+
+    assert len({id(sensor.device_info) for sensor in sensors}) == 1
+    assert sensors[0].device_info["identifiers"] == {("e-bloc", "entry")}
+    with pytest.raises(TypeError):
+        sensors[0].device_info["name"] = "Alt nume"
+    assert [sensor.unique_id for sensor in sensors][::5] == ["e-bloc_entry_client", "e-bloc_entry_plati_si_chitante"]
+
+
+def _output(sensors):
+    return [(sensor.state, sensor.extra_state_attributes) for sensor in sensors]
+
+
+async def test_stari_si_atribute(sensors_for):
+    home, apa_rece, apa_calda, caldura, curent, chitante = _output(sensors_for(RAW_DATA))
+
+    assert home[0] == "A12345F"
+    assert home[1]["Restanță de plată"] == "221.75 RON"
+    assert home[1]["Luna afișată"] == "2024-11"
+    assert apa_rece == ("80.258", {
+        "Index vechi": "79.344",
+        "Index nou": "80.258",
+        "Consum": "0.914",
+        "Luna afisata": "2024-11",
+        "Unitate masurare": "mc",
+    })
+    assert apa_calda[1]["Consum"] == "0.500"
+    assert caldura[0] == "Necunoscut"
+    assert curent[1]["Index nou"] == ""
+    assert chitante[0] == 2
+    assert chitante[1]["Sumă plătită 1"] == "262.51 RON"
+
+
+async def test_date_compacte_dau_aceleasi_senzori(sensors_for, integration_module):
+    compact_data = integration_module("ebloc.client").compact_data
+    compact = compact_data(copy.deepcopy(RAW_DATA))
+
+    assert "lista_luni" not in compact
+    assert "adresa" not in compact["home"]["1"]
+    assert _output(sensors_for(compact)) == _output(sensors_for(RAW_DATA))